@@ -0,0 +1,94 @@
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+from database.init_db import SCHEMA_PATH
+from database.db_operations import (
+    DatabaseManager, IDEA_SUMMARY_COLUMNS, CONVERSATION_SUMMARY_COLUMNS
+)
+
+def seed_database(db_path: str, rows: int, text_size: int):
+    """Fill a fresh database with `rows` conversations and `rows` ideas"""
+    conn = sqlite3.connect(db_path)
+    try:
+        with open(SCHEMA_PATH, 'r') as f:
+            conn.executescript(f.read())
+
+        big_text = "x" * text_size
+        conn.executemany(
+            "INSERT INTO conversations (title, raw_text, source, word_count) VALUES (?, ?, ?, ?)",
+            ((f"Conversation {i}", big_text, "transcribed", 1) for i in range(rows))
+        )
+        conn.executemany("""
+            INSERT INTO blog_post_ideas
+            (conversation_id, title, description,
+             usefulness_potential, fitwith_seo_strategy, fitwith_content_strategy,
+             inspiration_potential, collaboration_potential, innovation, difficulty,
+             total_score, sent_to_prod, raw_llm_response)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            (i % rows + 1, f"Idea {i}", "Benchmark idea",
+             5, 5, 5, 5, 5, 5, 5, 35 + i % 30, i % 2, big_text)
+            for i in range(rows)
+        ))
+        conn.commit()
+    finally:
+        conn.close()
+
+# Fields a listing reads from every row; records convert some of these lazily
+IDEA_LISTING_FIELDS = ("title", "total_score", "created_at", "sent_to_prod")
+CONVERSATION_LISTING_FIELDS = ("title", "word_count", "created_at", "status")
+
+def measure(label: str, read, fields: tuple, repeat: int):
+    """Print the best rows/sec out of `repeat` runs, loading only and loading plus reading `fields`"""
+    best_load = best_read = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = read()
+        loaded = time.perf_counter()
+        for row in rows:
+            for name in fields:
+                getattr(row, name)
+        best_load = min(best_load, loaded - start)
+        best_read = min(best_read, time.perf_counter() - start)
+    count = len(rows)
+    print(f"{label:<40} {count:>7} rows  {count / best_load:>12,.0f}  {count / best_read:>12,.0f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row-to-model materialisation")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--text-size", type=int, default=2_000, help="Size of raw_text / raw_llm_response")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        print(f"Seeding {args.rows:,} conversations and ideas...")
+        seed_database(db_path, args.rows, args.text_size)
+
+        validated = DatabaseManager(db_path)
+        fast = DatabaseManager(db_path, fast_reads=True)
+
+        print(f"\n{'rows/sec':<54} {'load':>12}  {'load + read':>12}")
+
+        print("get_all_ideas")
+        measure("validated", lambda: validated.get_all_ideas(limit=args.rows),
+                IDEA_LISTING_FIELDS, args.repeat)
+        measure("fast", lambda: fast.get_all_ideas(limit=args.rows),
+                IDEA_LISTING_FIELDS, args.repeat)
+        measure("fast + IDEA_SUMMARY_COLUMNS",
+                lambda: fast.get_all_ideas(limit=args.rows, columns=IDEA_SUMMARY_COLUMNS),
+                IDEA_LISTING_FIELDS, args.repeat)
+
+        print("\nget_all_conversations")
+        measure("validated", validated.get_all_conversations,
+                CONVERSATION_LISTING_FIELDS, args.repeat)
+        measure("fast", fast.get_all_conversations,
+                CONVERSATION_LISTING_FIELDS, args.repeat)
+        measure("fast + CONVERSATION_SUMMARY_COLUMNS",
+                lambda: fast.get_all_conversations(columns=CONVERSATION_SUMMARY_COLUMNS),
+                CONVERSATION_LISTING_FIELDS, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Sequence, Union
+from .models import (
+    Conversation, ConversationCreate,
+    BlogPostIdea, BlogPostIdeaCreate,
+    ConversationRecord, BlogPostIdeaRecord
+)
+from .db_operations import (
+    DATABASE_PATH,
+    _insert_conversation, _select_conversation, _select_all_conversations,
+    _update_conversation_status, _insert_blog_post_idea,
+    _select_ideas_by_conversation, _select_all_ideas, _select_idea,
+    _mark_idea_sent_to_prod, _select_pending_ideas,
+    _select_conversation_with_ideas, _select_dashboard_data
+)
+
+# Tells the writer thread to stop
+_STOP = object()
+
+class AsyncDatabaseManager:
+    """Async counterpart of DatabaseManager for asyncio-based graph execution.
+
+    Writes go through a queue to a single writer thread, which commits every
+    write waiting in the queue as one transaction (group commit). Reads run
+    on a small pool of reader threads, each with its own connection, which
+    WAL mode lets proceed while the writer is committing.
+    """
+
+    def __init__(self, db_path: str = DATABASE_PATH, reader_count: int = 4, max_batch_size: int = 64,
+                 fast_reads: bool = False):
+        self.db_path = db_path
+        # Return validation-free ConversationRecord / BlogPostIdeaRecord from
+        # reads; also enables `columns` projection (unfetched fields raise AttributeError)
+        self.fast_reads = fast_reads
+        self.max_batch_size = max_batch_size
+        # Ensure data directory exists
+        os.makedirs("data", exist_ok=True)
+
+        self._write_queue = queue.Queue()
+        self._closed = False
+
+        self._reader_local = threading.local()
+        self._reader_connections = []
+        self._reader_lock = threading.Lock()
+        self._readers = ThreadPoolExecutor(
+            max_workers=reader_count, thread_name_prefix="db-reader"
+        )
+
+        # Open the writer connection up front so WAL is enabled before any read
+        writer_conn = self._connect()
+        writer_conn.isolation_level = None  # Transactions are managed by the writer loop
+        writer_conn.execute("PRAGMA journal_mode=WAL")
+        self._writer = threading.Thread(
+            target=self._writer_loop, args=(writer_conn,), name="db-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self):
+        """Get database connection usable from a worker thread"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        return conn
+
+    # =================================
+    # WRITER / READER PLUMBING
+    # =================================
+
+    def _writer_loop(self, conn):
+        """Drain the write queue, committing each batch in one transaction"""
+        try:
+            while True:
+                batch = [self._write_queue.get()]
+                # Coalesce every write that queued up while we were busy
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(self._write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = any(item is _STOP for item in batch)
+                batch = [item for item in batch if item is not _STOP]
+                if batch:
+                    # A failed batch must not take the writer thread down with it
+                    try:
+                        self._commit_batch(conn, batch)
+                    except Exception as e:
+                        for _, _, future in batch:
+                            self._resolve(future, error=e)
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _resolve(future, result=None, error=None):
+        """Settle a write's future unless its caller already cancelled it"""
+        if future.done():
+            return
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass  # Cancelled between the check and the set
+
+    def _commit_batch(self, conn, batch):
+        """Run a batch of writes as one transaction, isolating each with a savepoint"""
+        results = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            for operation, args, future in batch:
+                # Skip writes cancelled while queued; running ones can no longer be cancelled
+                if not future.set_running_or_notify_cancel():
+                    continue
+                # A failing write only rolls back itself, not the rest of the batch
+                cursor.execute("SAVEPOINT write_op")
+                try:
+                    result = operation(cursor, *args)
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO write_op")
+                    results.append((future, None, e))
+                else:
+                    results.append((future, result, None))
+                cursor.execute("RELEASE write_op")
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+        # Only resolve once the commit is durable
+        for future, result, error in results:
+            self._resolve(future, result, error)
+
+    async def _write(self, operation, *args):
+        """Queue a write for the writer thread and wait for its commit"""
+        if self._closed:
+            raise RuntimeError("AsyncDatabaseManager is closed")
+        if not self._writer.is_alive():
+            raise RuntimeError("AsyncDatabaseManager writer thread has stopped")
+        future = Future()
+        self._write_queue.put((operation, args, future))
+        return await asyncio.wrap_future(future)
+
+    def _reader_connection(self):
+        """Get the calling reader thread's connection, opening it on first use"""
+        conn = getattr(self._reader_local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            conn.isolation_level = None  # Read snapshots are managed by _run_read
+            self._reader_local.conn = conn
+            with self._reader_lock:
+                self._reader_connections.append(conn)
+        return conn
+
+    def _run_read(self, operation, args, kwargs):
+        """Run a read inside one snapshot, so combined queries stay consistent"""
+        conn = self._reader_connection()
+        conn.execute("BEGIN")
+        try:
+            return operation(conn.cursor(), *args, fast=self.fast_reads, **kwargs)
+        finally:
+            conn.execute("COMMIT")
+
+    async def _read(self, operation, *args, **kwargs):
+        """Run a read on the reader pool"""
+        if self._closed:
+            raise RuntimeError("AsyncDatabaseManager is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, self._run_read, operation, args, kwargs)
+
+    async def close(self):
+        """Flush pending writes and close all connections"""
+        if self._closed:
+            return
+        self._closed = True
+        self._write_queue.put(_STOP)
+        await asyncio.to_thread(self._writer.join)
+        await asyncio.to_thread(self._readers.shutdown, True)
+        with self._reader_lock:
+            for conn in self._reader_connections:
+                conn.close()
+            self._reader_connections.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # =================================
+    # CONVERSATION OPERATIONS
+    # =================================
+
+    async def create_conversation(self, conversation: ConversationCreate) -> int:
+        """Insert new conversation and return ID"""
+        return await self._write(_insert_conversation, conversation)
+
+    async def get_conversation(self, conversation_id: int) -> Optional[Union[Conversation, ConversationRecord]]:
+        """Get conversation by ID"""
+        return await self._read(_select_conversation, conversation_id)
+
+    async def get_all_conversations(self, columns: Optional[Sequence[str]] = None) -> List[Union[Conversation, ConversationRecord]]:
+        """Get all conversations ordered by newest first"""
+        return await self._read(_select_all_conversations, columns=columns)
+
+    async def update_conversation_status(self, conversation_id: int, status: str):
+        """Update conversation status"""
+        await self._write(_update_conversation_status, conversation_id, status)
+
+    # =================================
+    # BLOG POST IDEA OPERATIONS
+    # =================================
+
+    async def create_blog_post_idea(self, idea: BlogPostIdeaCreate) -> int:
+        """Insert blog post idea and return ID"""
+        return await self._write(_insert_blog_post_idea, idea)
+
+    async def get_ideas_by_conversation(self, conversation_id: int,
+                                        columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+        """Get all blog post ideas for a conversation"""
+        return await self._read(_select_ideas_by_conversation, conversation_id, columns=columns)
+
+    async def get_all_ideas(self, limit: int = 50, columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+        """Get all blog post ideas ordered by highest score"""
+        return await self._read(_select_all_ideas, limit, columns=columns)
+
+    async def get_idea(self, idea_id: int) -> Optional[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+        """Get single blog post idea by ID"""
+        return await self._read(_select_idea, idea_id)
+
+    async def mark_idea_sent_to_prod(self, idea_id: int) -> bool:
+        """Mark a blog post idea as sent to production"""
+        return await self._write(_mark_idea_sent_to_prod, idea_id)
+
+    async def get_pending_ideas(self, limit: int = 20, columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+        """Get blog post ideas not yet sent to production"""
+        return await self._read(_select_pending_ideas, limit, columns=columns)
+
+    # =================================
+    # COMBINED QUERIES
+    # =================================
+
+    async def get_conversation_with_ideas(self, conversation_id: int) -> Optional[Dict[str, Any]]:
+        """Get conversation and all its ideas together"""
+        return await self._read(_select_conversation_with_ideas, conversation_id)
+
+    async def get_dashboard_data(self) -> Dict[str, Any]:
+        """Get overview data for dashboard"""
+        return await self._read(_select_dashboard_data)
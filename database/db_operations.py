@@ -1,19 +1,243 @@
 import sqlite3
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Union
 from datetime import datetime
 from .models import (
     Conversation, ConversationCreate, 
     BlogPostIdea, BlogPostIdeaCreate,
-    ProcessingStatus
+    ProcessingStatus,
+    ConversationRecord, BlogPostIdeaRecord
 )
 
 # Database path points to /data folder
 DATABASE_PATH = "data/app.db"
 
+# Idea columns without the large raw_llm_response TEXT, for listings
+IDEA_SUMMARY_COLUMNS = tuple(
+    name for name in BlogPostIdea.model_fields if name != "raw_llm_response"
+)
+
+# Conversation columns without the large raw_text TEXT, for listings
+CONVERSATION_SUMMARY_COLUMNS = tuple(
+    name for name in Conversation.model_fields if name != "raw_text"
+)
+
+# =================================
+# ROW MATERIALISATION
+# =================================
+# Fast reads skip Pydantic validation for rows we wrote ourselves: each row
+# becomes a tuple-backed record (see models.ReadRecord) with no per-field work.
+
+_RECORD_TYPES = {
+    Conversation: ConversationRecord,
+    BlogPostIdea: BlogPostIdeaRecord,
+}
+
+# Row factories per record type, so each projection builds its factory once
+_ROW_FACTORIES = {}
+
+def _record_row_factory(record_type):
+    if record_type not in _ROW_FACTORIES:
+        new = tuple.__new__
+        
+        def factory(cursor, row):
+            return new(record_type, row)
+        
+        _ROW_FACTORIES[record_type] = factory
+    return _ROW_FACTORIES[record_type]
+
+def _projection(model, columns: Optional[Sequence[str]]):
+    """Resolve the record type for `columns`, validating the column names"""
+    record_type = _RECORD_TYPES[model]
+    if columns is None:
+        return record_type
+    if not columns:
+        raise ValueError("Column projection needs at least one column")
+    unknown = [name for name in columns if name not in model.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown {model.__name__} columns: {unknown}")
+    return record_type.projection(columns)
+
+def _fetch_models(cursor, model, sql: str, params: tuple = (), fast: bool = False,
+                  columns: Optional[Sequence[str]] = None, one: bool = False):
+    """Run a `SELECT {columns} ...` query and return `model` instances (or records when fast)"""
+    if not fast:
+        if columns is not None:
+            raise ValueError("Column projection requires fast reads")
+        cursor.execute(sql.format(columns="*"), params)
+        if one:
+            row = cursor.fetchone()
+            return model(**dict(row)) if row else None
+        return [model(**dict(row)) for row in cursor.fetchall()]
+    
+    # Only the projected columns are selected, so ORDER BY always sees real columns
+    record_type = _projection(model, columns)
+    previous_factory = cursor.row_factory
+    cursor.row_factory = _record_row_factory(record_type)
+    try:
+        cursor.execute(sql.format(columns=", ".join(record_type._fields)), params)
+        return cursor.fetchone() if one else cursor.fetchall()
+    finally:
+        cursor.row_factory = previous_factory
+
+
+# =================================
+# QUERY HELPERS
+# =================================
+# Each helper runs against a cursor and leaves transaction handling to the
+# caller, so the sync and async managers share the same SQL.
+
+def _insert_conversation(cursor, conversation: ConversationCreate) -> int:
+    cursor.execute("""
+        INSERT INTO conversations (title, raw_text, source, word_count)
+        VALUES (?, ?, ?, ?)
+    """, (
+        conversation.title, 
+        conversation.raw_text, 
+        conversation.source,
+        conversation.word_count
+    ))
+    return cursor.lastrowid
+
+def _select_conversation(cursor, conversation_id: int, fast: bool = False) -> Optional[Union[Conversation, ConversationRecord]]:
+    return _fetch_models(
+        cursor, Conversation,
+        "SELECT {columns} FROM conversations WHERE id = ?",
+        (conversation_id,), fast=fast, one=True
+    )
+
+def _select_all_conversations(cursor, fast: bool = False,
+                              columns: Optional[Sequence[str]] = None) -> List[Union[Conversation, ConversationRecord]]:
+    return _fetch_models(
+        cursor, Conversation,
+        "SELECT {columns} FROM conversations ORDER BY created_at DESC",
+        fast=fast, columns=columns
+    )
+
+def _update_conversation_status(cursor, conversation_id: int, status: str):
+    cursor.execute(
+        "UPDATE conversations SET status = ? WHERE id = ?",
+        (status, conversation_id)
+    )
+
+def _insert_blog_post_idea(cursor, idea: BlogPostIdeaCreate) -> int:
+    # Calculate total_score (not in the model, computed here)
+    total_score = (
+        idea.usefulness_potential +
+        idea.fitwith_seo_strategy +
+        idea.fitwith_content_strategy +
+        idea.inspiration_potential +
+        idea.collaboration_potential +
+        idea.innovation +
+        idea.difficulty
+    )
+    
+    # INSERT with 13 columns (12 from model + 1 calculated)
+    cursor.execute("""
+        INSERT INTO blog_post_ideas 
+        (conversation_id, title, description, 
+         usefulness_potential, fitwith_seo_strategy, fitwith_content_strategy,
+         inspiration_potential, collaboration_potential, innovation, difficulty,
+         total_score, sent_to_prod, raw_llm_response)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        idea.conversation_id,           # 1
+        idea.title,                     # 2
+        idea.description,               # 3
+        idea.usefulness_potential,      # 4
+        idea.fitwith_seo_strategy,      # 5
+        idea.fitwith_content_strategy,  # 6
+        idea.inspiration_potential,     # 7
+        idea.collaboration_potential,   # 8
+        idea.innovation,                # 9
+        idea.difficulty,                # 10
+        total_score,                    # 11 (CALCULATED)
+        idea.sent_to_prod,              # 12
+        idea.raw_llm_response           # 13
+    ))
+    return cursor.lastrowid
+
+def _select_ideas_by_conversation(cursor, conversation_id: int, fast: bool = False,
+                                  columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+    return _fetch_models(
+        cursor, BlogPostIdea,
+        "SELECT {columns} FROM blog_post_ideas WHERE conversation_id = ? ORDER BY total_score DESC",
+        (conversation_id,), fast=fast, columns=columns
+    )
+
+def _select_all_ideas(cursor, limit: int, fast: bool = False,
+                      columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+    return _fetch_models(
+        cursor, BlogPostIdea,
+        "SELECT {columns} FROM blog_post_ideas ORDER BY total_score DESC LIMIT ?",
+        (limit,), fast=fast, columns=columns
+    )
+
+def _select_idea(cursor, idea_id: int, fast: bool = False) -> Optional[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+    return _fetch_models(
+        cursor, BlogPostIdea,
+        "SELECT {columns} FROM blog_post_ideas WHERE id = ?",
+        (idea_id,), fast=fast, one=True
+    )
+
+def _mark_idea_sent_to_prod(cursor, idea_id: int) -> bool:
+    cursor.execute(
+        "UPDATE blog_post_ideas SET sent_to_prod = 1 WHERE id = ?",
+        (idea_id,)
+    )
+    return cursor.rowcount > 0  # Return True if a row was updated
+
+def _select_pending_ideas(cursor, limit: int, fast: bool = False,
+                          columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
+    return _fetch_models(
+        cursor, BlogPostIdea,
+        "SELECT {columns} FROM blog_post_ideas WHERE sent_to_prod = 0 ORDER BY total_score DESC LIMIT ?",
+        (limit,), fast=fast, columns=columns
+    )
+
+def _select_conversation_with_ideas(cursor, conversation_id: int, fast: bool = False) -> Optional[Dict[str, Any]]:
+    conversation = _select_conversation(cursor, conversation_id, fast=fast)
+    if not conversation:
+        return None
+    
+    ideas = _select_ideas_by_conversation(cursor, conversation_id, fast=fast)
+    
+    return {
+        "conversation": conversation,
+        "ideas": ideas,
+        "idea_count": len(ideas),
+        "best_score": max([idea.total_score for idea in ideas], default=0)
+    }
+
+def _select_dashboard_data(cursor, fast: bool = False) -> Dict[str, Any]:
+    # Count conversations
+    cursor.execute("SELECT COUNT(*) FROM conversations")
+    conversation_count = cursor.fetchone()[0]
+    
+    # Count ideas
+    cursor.execute("SELECT COUNT(*) FROM blog_post_ideas")
+    idea_count = cursor.fetchone()[0]
+    
+    # Get top ideas (fast reads leave out raw_llm_response)
+    top_ideas = _fetch_models(cursor, BlogPostIdea, """
+        SELECT {columns} FROM blog_post_ideas 
+        ORDER BY total_score DESC 
+        LIMIT 10
+    """, fast=fast, columns=IDEA_SUMMARY_COLUMNS if fast else None)
+    
+    return {
+        "conversation_count": conversation_count,
+        "idea_count": idea_count,
+        "top_ideas": top_ideas
+    }
+
+
 class DatabaseManager:
-    def __init__(self, db_path: str = DATABASE_PATH):
+    def __init__(self, db_path: str = DATABASE_PATH, fast_reads: bool = False):
         self.db_path = db_path
+        # Return validation-free ConversationRecord / BlogPostIdeaRecord from
+        # reads; also enables `columns` projection (unfetched fields raise AttributeError)
+        self.fast_reads = fast_reads
         # Ensure data directory exists
         os.makedirs("data", exist_ok=True)
     
@@ -31,42 +255,25 @@ class DatabaseManager:
         """Insert new conversation and return ID"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO conversations (title, raw_text, source, word_count)
-                VALUES (?, ?, ?, ?)
-            """, (
-                conversation.title, 
-                conversation.raw_text, 
-                conversation.source,
-                conversation.word_count
-            ))
+            result = _insert_conversation(conn.cursor(), conversation)
             conn.commit()
-            return cursor.lastrowid
+            return result
         finally:
             conn.close()
     
-    def get_conversation(self, conversation_id: int) -> Optional[Conversation]:
+    def get_conversation(self, conversation_id: int) -> Optional[Union[Conversation, ConversationRecord]]:
         """Get conversation by ID"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM conversations WHERE id = ?", (conversation_id,))
-            row = cursor.fetchone()
-            if row:
-                return Conversation(**dict(row))
-            return None
+            return _select_conversation(conn.cursor(), conversation_id, fast=self.fast_reads)
         finally:
             conn.close()
     
-    def get_all_conversations(self) -> List[Conversation]:
+    def get_all_conversations(self, columns: Optional[Sequence[str]] = None) -> List[Union[Conversation, ConversationRecord]]:
         """Get all conversations ordered by newest first"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM conversations ORDER BY created_at DESC")
-            rows = cursor.fetchall()
-            return [Conversation(**dict(row)) for row in rows]
+            return _select_all_conversations(conn.cursor(), fast=self.fast_reads, columns=columns)
         finally:
             conn.close()
     
@@ -74,11 +281,7 @@ class DatabaseManager:
         """Update conversation status"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE conversations SET status = ? WHERE id = ?",
-                (status, conversation_id)
-            )
+            _update_conversation_status(conn.cursor(), conversation_id, status)
             conn.commit()
         finally:
             conn.close()
@@ -91,87 +294,34 @@ class DatabaseManager:
         """Insert blog post idea and return ID"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            
-            # Calculate total_score (not in the model, computed here)
-            total_score = (
-                idea.usefulness_potential +
-                idea.fitwith_seo_strategy +
-                idea.fitwith_content_strategy +
-                idea.inspiration_potential +
-                idea.collaboration_potential +
-                idea.innovation +
-                idea.difficulty
-            )
-            
-            # INSERT with 13 columns (12 from model + 1 calculated)
-            cursor.execute("""
-                INSERT INTO blog_post_ideas 
-                (conversation_id, title, description, 
-                 usefulness_potential, fitwith_seo_strategy, fitwith_content_strategy,
-                 inspiration_potential, collaboration_potential, innovation, difficulty,
-                 total_score, sent_to_prod, raw_llm_response)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                idea.conversation_id,           # 1
-                idea.title,                     # 2
-                idea.description,               # 3
-                idea.usefulness_potential,      # 4
-                idea.fitwith_seo_strategy,      # 5
-                idea.fitwith_content_strategy,  # 6
-                idea.inspiration_potential,     # 7
-                idea.collaboration_potential,   # 8
-                idea.innovation,                # 9
-                idea.difficulty,                # 10
-                total_score,                    # 11 (CALCULATED)
-                idea.sent_to_prod,              # 12
-                idea.raw_llm_response           # 13
-            ))
-            
+            result = _insert_blog_post_idea(conn.cursor(), idea)
             conn.commit()
-            return cursor.lastrowid
-            
+            return result
         finally:
             conn.close()
     
-    def get_ideas_by_conversation(self, conversation_id: int) -> List[BlogPostIdea]:
+    def get_ideas_by_conversation(self, conversation_id: int,
+                                  columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
         """Get all blog post ideas for a conversation"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM blog_post_ideas WHERE conversation_id = ? ORDER BY total_score DESC",
-                (conversation_id,)
-            )
-            rows = cursor.fetchall()
-            return [BlogPostIdea(**dict(row)) for row in rows]
+            return _select_ideas_by_conversation(conn.cursor(), conversation_id, fast=self.fast_reads, columns=columns)
         finally:
             conn.close()
     
-    def get_all_ideas(self, limit: int = 50) -> List[BlogPostIdea]:
+    def get_all_ideas(self, limit: int = 50, columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
         """Get all blog post ideas ordered by highest score"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM blog_post_ideas ORDER BY total_score DESC LIMIT ?",
-                (limit,)
-            )
-            rows = cursor.fetchall()
-            return [BlogPostIdea(**dict(row)) for row in rows]
+            return _select_all_ideas(conn.cursor(), limit, fast=self.fast_reads, columns=columns)
         finally:
             conn.close()
     
-    def get_idea(self, idea_id: int) -> Optional[BlogPostIdea]:
+    def get_idea(self, idea_id: int) -> Optional[Union[BlogPostIdea, BlogPostIdeaRecord]]:
         """Get single blog post idea by ID"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM blog_post_ideas WHERE id = ?", (idea_id,))
-            row = cursor.fetchone()
-            if row:
-                return BlogPostIdea(**dict(row))
-            return None
+            return _select_idea(conn.cursor(), idea_id, fast=self.fast_reads)
         finally:
             conn.close()
     
@@ -179,27 +329,17 @@ class DatabaseManager:
         """Mark a blog post idea as sent to production"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE blog_post_ideas SET sent_to_prod = 1 WHERE id = ?",
-                (idea_id,)
-            )
+            result = _mark_idea_sent_to_prod(conn.cursor(), idea_id)
             conn.commit()
-            return cursor.rowcount > 0  # Return True if a row was updated
+            return result
         finally:
             conn.close()
     
-    def get_pending_ideas(self, limit: int = 20) -> List[BlogPostIdea]:
+    def get_pending_ideas(self, limit: int = 20, columns: Optional[Sequence[str]] = None) -> List[Union[BlogPostIdea, BlogPostIdeaRecord]]:
         """Get blog post ideas not yet sent to production"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM blog_post_ideas WHERE sent_to_prod = 0 ORDER BY total_score DESC LIMIT ?",
-                (limit,)
-            )
-            rows = cursor.fetchall()
-            return [BlogPostIdea(**dict(row)) for row in rows]
+            return _select_pending_ideas(conn.cursor(), limit, fast=self.fast_reads, columns=columns)
         finally:
             conn.close()
     
@@ -209,46 +349,17 @@ class DatabaseManager:
     
     def get_conversation_with_ideas(self, conversation_id: int) -> Optional[Dict[str, Any]]:
         """Get conversation and all its ideas together"""
-        conversation = self.get_conversation(conversation_id)
-        if not conversation:
-            return None
-        
-        ideas = self.get_ideas_by_conversation(conversation_id)
-        
-        return {
-            "conversation": conversation,
-            "ideas": ideas,
-            "idea_count": len(ideas),
-            "best_score": max([idea.total_score for idea in ideas], default=0)
-        }
+        conn = self.get_connection()
+        try:
+            return _select_conversation_with_ideas(conn.cursor(), conversation_id, fast=self.fast_reads)
+        finally:
+            conn.close()
     
     def get_dashboard_data(self) -> Dict[str, Any]:
         """Get overview data for dashboard"""
         conn = self.get_connection()
         try:
-            cursor = conn.cursor()
-            
-            # Count conversations
-            cursor.execute("SELECT COUNT(*) FROM conversations")
-            conversation_count = cursor.fetchone()[0]
-            
-            # Count ideas
-            cursor.execute("SELECT COUNT(*) FROM blog_post_ideas")
-            idea_count = cursor.fetchone()[0]
-            
-            # Get top ideas
-            cursor.execute("""
-                SELECT * FROM blog_post_ideas 
-                ORDER BY total_score DESC 
-                LIMIT 10
-            """)
-            top_ideas = [BlogPostIdea(**dict(row)) for row in cursor.fetchall()]
-            
-            return {
-                "conversation_count": conversation_count,
-                "idea_count": idea_count,
-                "top_ideas": top_ideas
-            }
+            return _select_dashboard_data(conn.cursor(), fast=self.fast_reads)
         finally:
             conn.close()
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from operator import itemgetter
+from typing import Optional, List, get_args
 
 # =================================
 # CONVERSATION MODELS
@@ -101,4 +102,98 @@ class ProcessingStatus(BaseModel):
     status: str
     error_message: Optional[str]
     started_at: datetime
-    completed_at: Optional[datetime]
\ No newline at end of file
+    completed_at: Optional[datetime]
+
+# =================================
+# FAST READ RECORDS
+# =================================
+
+class ReadRecord(tuple):
+    """Tuple-backed, validation-free stand-in for a read model.
+    
+    Built straight from a SQLite row, with the same attributes as the model.
+    Values SQLite stores differently (datetimes, booleans) are converted on
+    attribute access. Records from a column projection only hold the fetched
+    fields; reading any other field raises AttributeError.
+    """
+    __slots__ = ()
+    _model = None
+    _fields = ()   # Fetched fields, in row order
+    _missing = ()  # Model fields left out of the projection
+    
+    @classmethod
+    def projection(cls, columns) -> type:
+        """Get the record type holding only `columns`, in model field order"""
+        columns = tuple(name for name in cls._model.model_fields if name in columns)
+        if columns == cls._fields:
+            return cls
+        key = (cls, columns)
+        if key not in _PROJECTIONS:
+            _PROJECTIONS[key] = _record_type(cls._model, columns, base=cls)
+        return _PROJECTIONS[key]
+    
+    def model_dump(self) -> dict:
+        """Return the fetched fields as a dict of converted values"""
+        return {name: getattr(self, name) for name in self._fields}
+    
+    def to_model(self):
+        """Validate the record into its Pydantic model"""
+        if self._missing:
+            raise ValueError(
+                f"Cannot build {self._model.__name__} from a partial record, "
+                f"missing columns: {list(self._missing)}"
+            )
+        return self._model(**self.model_dump())
+    
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+# Record types per (full record type, projected columns)
+_PROJECTIONS = {}
+
+# How record attributes convert the raw SQLite value, by field type
+_RECORD_CONVERTERS = {
+    datetime: datetime.fromisoformat,
+    bool: bool,
+}
+
+def _record_accessor(index: int, annotation):
+    """Build the property reading field `index` of a record"""
+    types = get_args(annotation) or (annotation,)
+    convert = next((_RECORD_CONVERTERS[t] for t in types if t in _RECORD_CONVERTERS), None)
+    if convert is None:
+        return property(itemgetter(index))
+    
+    def getter(self):
+        value = self[index]
+        return convert(value) if value is not None else value
+    return property(getter)
+
+def _missing_accessor(name: str):
+    """Build the property for a field left out of the projection"""
+    def getter(self):
+        raise AttributeError(
+            f"{type(self).__name__}.{name} was not fetched; add it to `columns` to read it"
+        )
+    return property(getter)
+
+def _record_type(model, columns=None, base=ReadRecord):
+    """Create the ReadRecord subclass for `model`, holding `columns` (default: all fields)"""
+    fields = tuple(model.model_fields) if columns is None else columns
+    namespace = {
+        "__slots__": (),
+        "_model": model,
+        "_fields": fields,
+        "_missing": tuple(name for name in model.model_fields if name not in fields),
+    }
+    for name, field in model.model_fields.items():
+        if name in fields:
+            namespace[name] = _record_accessor(fields.index(name), field.annotation)
+        else:
+            namespace[name] = _missing_accessor(name)
+    name = base.__name__ if base is not ReadRecord else f"{model.__name__}Record"
+    return type(name, (base,), namespace)
+
+ConversationRecord = _record_type(Conversation)
+BlogPostIdeaRecord = _record_type(BlogPostIdea)
@@ -1,6 +1,9 @@
-from database.init_db import create_database, reset_database
-from database.db_operations import db
-from database.models import ConversationCreate, BlogPostIdeaCreate
+import asyncio
+import sqlite3
+from database.init_db import create_database, reset_database, DATABASE_PATH
+from database.db_operations import db, DatabaseManager, IDEA_SUMMARY_COLUMNS
+from database.async_db_operations import AsyncDatabaseManager
+from database.models import ConversationCreate, BlogPostIdeaCreate, BlogPostIdeaRecord
 
 def test_database_complete():
     """Complete test of database functionality"""
@@ -118,5 +121,251 @@ def test_database_complete():
     print("🎉 Database test completed successfully!")
     print(f"📁 Database file created at: data/app.db")
 
+def test_async_database():
+    """Test concurrent writes and reads through AsyncDatabaseManager"""
+    print("🧪 Starting async database test...\n")
+    reset_database()
+    
+    async def run():
+        async with AsyncDatabaseManager() as async_db:
+            # Concurrent writes get coalesced into group commits
+            print("1. Creating conversations concurrently...")
+            conversation_ids = await asyncio.gather(*[
+                async_db.create_conversation(ConversationCreate(
+                    title=f"Concurrent pipeline {i}",
+                    raw_text=f"Transcript number {i} about AI content operations",
+                    source="transcribed"
+                ))
+                for i in range(20)
+            ])
+            assert len(set(conversation_ids)) == 20
+            print(f"✅ Created {len(conversation_ids)} conversations")
+            
+            print("2. Saving ideas concurrently...")
+            idea_ids = await asyncio.gather(*[
+                async_db.create_blog_post_idea(BlogPostIdeaCreate(
+                    conversation_id=conversation_id,
+                    title=f"Idea for conversation {conversation_id}",
+                    description="Generated during async test",
+                    usefulness_potential=8,
+                    fitwith_seo_strategy=7,
+                    fitwith_content_strategy=6,
+                    inspiration_potential=5,
+                    collaboration_potential=4,
+                    innovation=3,
+                    difficulty=2
+                ))
+                for conversation_id in conversation_ids
+            ])
+            assert len(set(idea_ids)) == 20
+            print(f"✅ Created {len(idea_ids)} ideas")
+            
+            # A failing write must not roll back the rest of its batch
+            print("3. Mixing a failing write into a batch...")
+            results = await asyncio.gather(
+                async_db.update_conversation_status(conversation_ids[0], "completed"),
+                async_db.update_conversation_status(conversation_ids[1], "not-a-status"),
+                async_db.mark_idea_sent_to_prod(idea_ids[0]),
+                return_exceptions=True
+            )
+            assert isinstance(results[1], sqlite3.IntegrityError)
+            assert results[2] is True
+            conversation = await async_db.get_conversation(conversation_ids[0])
+            assert conversation.status == "completed"
+            print("✅ Invalid write rejected, rest of batch committed")
+            
+            print("4. Reading concurrently...")
+            conversations, pending, dashboard, combined = await asyncio.gather(
+                async_db.get_all_conversations(),
+                async_db.get_pending_ideas(limit=50),
+                async_db.get_dashboard_data(),
+                async_db.get_conversation_with_ideas(conversation_ids[0])
+            )
+            assert len(conversations) == 20
+            assert len(pending) == 19
+            assert dashboard["idea_count"] == 20
+            assert combined["idea_count"] == 1
+            print(f"✅ Dashboard: {dashboard['conversation_count']} conversations, {dashboard['idea_count']} ideas")
+    
+    asyncio.run(run())
+    
+    # Writes are visible to the sync manager too
+    assert len(db.get_all_conversations()) == 20
+    print("🎉 Async database test completed successfully!")
+
+def test_async_cancelled_write():
+    """Test that cancelling a queued write leaves the writer thread working"""
+    print("🧪 Starting async cancelled write test...\n")
+    reset_database()
+    
+    def conversation(title):
+        return ConversationCreate(title=title, raw_text=f"Transcript for {title} pipeline run")
+    
+    async def run():
+        async with AsyncDatabaseManager() as async_db:
+            # Hold the write lock so the writer blocks on its first batch
+            blocker = sqlite3.connect(DATABASE_PATH)
+            blocker.execute("BEGIN IMMEDIATE")
+            try:
+                busy = asyncio.create_task(async_db.create_conversation(conversation("busy")))
+                await asyncio.sleep(0.2)
+                
+                # Both queue up behind the busy batch; cancel one of them
+                cancelled = asyncio.create_task(async_db.create_conversation(conversation("cancelled")))
+                kept = asyncio.create_task(async_db.create_conversation(conversation("kept")))
+                await asyncio.sleep(0)
+                cancelled.cancel()
+            finally:
+                blocker.rollback()
+                blocker.close()
+            
+            print("1. Waiting for the remaining writes...")
+            try:
+                await cancelled
+            except asyncio.CancelledError:
+                pass
+            else:
+                raise AssertionError("Expected the write to be cancelled")
+            busy_id, kept_id = await asyncio.wait_for(asyncio.gather(busy, kept), timeout=5)
+            later_id = await asyncio.wait_for(
+                async_db.create_conversation(conversation("later")), timeout=5
+            )
+            assert len({busy_id, kept_id, later_id}) == 3
+            print("✅ Rest of the batch and a later write completed")
+            
+            titles = {c.title for c in await async_db.get_all_conversations()}
+            assert titles == {"busy", "kept", "later"}
+            print("✅ Cancelled write was never committed")
+    
+    asyncio.run(run())
+    print("🎉 Async cancelled write test completed successfully!")
+
+def test_fast_reads():
+    """Test that fast reads match validated reads and honour column projection"""
+    print("🧪 Starting fast read test...\n")
+    reset_database()
+    
+    conversation_id = db.create_conversation(ConversationCreate(
+        title="Fast read conversation",
+        raw_text="A conversation long enough to pass validation",
+        source="manual"
+    ))
+    for score in (3, 9):
+        db.create_blog_post_idea(BlogPostIdeaCreate(
+            conversation_id=conversation_id,
+            title=f"Idea scoring {score}",
+            description="Fast read idea",
+            usefulness_potential=score,
+            fitwith_seo_strategy=5,
+            fitwith_content_strategy=5,
+            inspiration_potential=5,
+            collaboration_potential=5,
+            innovation=5,
+            difficulty=5,
+            raw_llm_response="A large LLM response"
+        ))
+    db.mark_idea_sent_to_prod(1)
+    
+    fast_db = DatabaseManager(fast_reads=True)
+    
+    # Records convert to exactly the models the validated path returns
+    print("1. Comparing fast and validated reads...")
+    assert fast_db.get_conversation(conversation_id).to_model() == db.get_conversation(conversation_id)
+    assert [idea.to_model() for idea in fast_db.get_all_ideas()] == db.get_all_ideas()
+    assert fast_db.get_idea(999) is None
+    
+    idea = fast_db.get_idea(1)
+    assert idea.sent_to_prod is True
+    assert idea.created_at == db.get_idea(1).created_at
+    print(f"✅ {idea!r}")
+    
+    print("2. Testing column projection...")
+    summaries = fast_db.get_all_ideas(columns=IDEA_SUMMARY_COLUMNS)
+    assert [summary.title for summary in summaries] == ["Idea scoring 9", "Idea scoring 3"]
+    assert not hasattr(summaries[0], "raw_llm_response")
+    assert "raw_llm_response" not in repr(summaries[0])
+    assert isinstance(summaries[0], BlogPostIdeaRecord)
+    assert not hasattr(fast_db.get_dashboard_data()["top_ideas"][0], "raw_llm_response")
+    
+    conversation = fast_db.get_all_conversations(columns=("id", "title"))[0]
+    assert conversation.model_dump() == {"id": conversation_id, "title": "Fast read conversation"}
+    try:
+        conversation.to_model()
+    except ValueError as e:
+        assert "raw_text" in str(e) and "created_at" in str(e)
+    else:
+        raise AssertionError("Expected ValueError for a partial record")
+    
+    for manager, columns in ((db, ("id",)), (fast_db, ("id", "not_a_column")), (fast_db, ())):
+        try:
+            manager.get_all_ideas(columns=columns)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Expected ValueError for invalid projection")
+    print("✅ Projection skips unused columns")
+    
+    print("🎉 Fast read test completed successfully!")
+
+def test_fast_read_projection_order():
+    """Test that leaving out the sort column keeps ORDER BY and LIMIT correct"""
+    print("🧪 Starting projection order test...\n")
+    reset_database()
+    
+    conversation_ids = [
+        db.create_conversation(ConversationCreate(
+            title=f"Conversation {i}",
+            raw_text="A conversation long enough to pass validation"
+        ))
+        for i in range(3)
+    ]
+    # Spread created_at so the newest-first order is well defined
+    conn = sqlite3.connect(DATABASE_PATH)
+    try:
+        for day, conversation_id in zip((2, 3, 1), conversation_ids):
+            conn.execute(
+                "UPDATE conversations SET created_at = ? WHERE id = ?",
+                (f"2025-01-0{day} 10:00:00", conversation_id)
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    
+    for score in (1, 9, 5, 3, 10):
+        idea_id = db.create_blog_post_idea(BlogPostIdeaCreate(
+            conversation_id=conversation_ids[0],
+            title=f"s{score}",
+            description="Projection order idea",
+            usefulness_potential=score,
+            fitwith_seo_strategy=5,
+            fitwith_content_strategy=5,
+            inspiration_potential=5,
+            collaboration_potential=5,
+            innovation=5,
+            difficulty=5
+        ))
+        if score == 9:
+            db.mark_idea_sent_to_prod(idea_id)
+    
+    fast_db = DatabaseManager(fast_reads=True)
+    columns = ("id", "title")  # Leaves out total_score and created_at
+    
+    titles = lambda records: [record.title for record in records]
+    assert titles(fast_db.get_all_ideas(limit=2, columns=columns)) == ["s10", "s9"]
+    assert titles(fast_db.get_pending_ideas(limit=2, columns=columns)) == ["s10", "s5"]
+    assert titles(fast_db.get_ideas_by_conversation(conversation_ids[0], columns=columns)) == [
+        "s10", "s9", "s5", "s3", "s1"
+    ]
+    assert titles(fast_db.get_all_conversations(columns=columns)) == [
+        "Conversation 1", "Conversation 0", "Conversation 2"
+    ]
+    print("✅ Projected reads keep their order and limit")
+    
+    print("🎉 Projection order test completed successfully!")
+
 if __name__ == "__main__":
-    test_database_complete()
\ No newline at end of file
+    test_database_complete()
+    test_async_database()
+    test_async_cancelled_write()
+    test_fast_reads()
+    test_fast_read_projection_order()
\ No newline at end of file